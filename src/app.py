@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException, Depends
 import sqlite3
 import os
+from functools import lru_cache
 from models import ProductSentimentSummary
 from fastapi import Security, HTTPException
 from fastapi.security import APIKeyHeader
@@ -42,39 +43,53 @@ app = FastAPI(
 
 )
 
-def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Returns dict-like rows
-    return conn
+# One shared read-only connection; the ETL output is never written while the API runs,
+# so immutable=1 also lets SQLite skip file locking and WAL checks on every read
+conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro&immutable=1&cache=shared",
+                       uri=True, check_same_thread=False)
+
+# Kept as one constant so sqlite3's per-connection statement cache reuses the prepared query
+LATEST_SENTIMENT_SQL = """
+    SELECT
+        product_id,
+        product_name,
+        CAST(rating AS INTEGER) AS latest_sentiment_score,
+        rolling_average_sentiment
+    FROM latest_product_sentiment
+    WHERE product_id = ?
+"""
 
 @app.get("/health", tags=["Health"],summary="To check Database connectivity")
 def health_check():
     try:
-        conn = get_db()
         conn.execute("SELECT 1")
         return {"status": "ok", "database": "connected"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database connection failed: {str(e)}")
 
 
+@lru_cache(maxsize=4096)
+def get_latest_sentiment(product_id: int):
+    # ETL output is read-only once served, so results are cached per product
+    row = conn.execute(LATEST_SENTIMENT_SQL, (product_id,)).fetchone()
+    if row is None:
+        return None
+    product_id, product_name, latest_sentiment_score, rolling_average_sentiment = row
+    # Columns are already typed by the SQL above, so skip Pydantic validation
+    return ProductSentimentSummary.model_construct(
+        product_id=product_id,
+        product_name=product_name,
+        latest_sentiment_score=latest_sentiment_score,
+        rolling_average_sentiment=rolling_average_sentiment,
+    )
+
+
 @app.get("/api/v1/sentiment/{product_id}",dependencies=[Depends(verify_api_key)], response_model=ProductSentimentSummary, tags=["Sentiment"],summary="Get Product Sentiment by product id")
 def get_product_sentiment(product_id: int):
-    conn=get_db()
-    cursor = conn.execute("""
-        SELECT 
-            product_id,
-            product_name,
-            rating AS latest_sentiment_score,
-            rolling_average_sentiment
-        FROM product_rolling_sentiment
-        WHERE product_id = ?
-        ORDER BY date DESC
-        LIMIT 1
-    """, (product_id,))
-    row = cursor.fetchone()
-    if not row:
+    summary = get_latest_sentiment(product_id)
+    if summary is None:
         raise HTTPException(status_code=404, detail=f"No data found for product_id {product_id}")
-    return dict(row)
+    return summary
 
 
 # ═══════════════════════════════════════════════════════
@@ -99,4 +114,7 @@ if __name__ == "__main__":
   Press Ctrl+C to stop the server
 """)
     
-    uvicorn.run(app, host="127.0.0.1", port=8000, log_level="info")
+    # uvloop + httptools (from uvicorn[standard]); workers need the app as an import string.
+    # Worker count comes from WEB_CONCURRENCY, the same variable the uvicorn CLI reads.
+    uvicorn.run("app:app", host="127.0.0.1", port=8000, log_level="info",
+                loop="uvloop", http="httptools", workers=int(os.getenv("WEB_CONCURRENCY", "1")))
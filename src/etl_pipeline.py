@@ -19,11 +19,17 @@ Usage:
 import os
 import sys
 import sqlite3
-import unicodedata
+import xml.etree.ElementTree as ET
+from functools import lru_cache
 
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 import numpy as np
-from textblob import TextBlob
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import textblob
+from numba import njit, prange
 
 
 # ──────────────────────────────────────────────
@@ -34,6 +40,59 @@ CSV_PATH = os.path.join(BASE_DIR, "..", "data", "reviews.csv")
 DB_PATH = os.path.join(BASE_DIR, "..", "data", "reviews_db.sqlite")
 ROLLING_WINDOW = 3
 
+# Known column types for the Arrow CSV reader (these columns skip type inference).
+# Numerics use the narrowest type that fits their range (age 0-120, rating 0-5,
+# 0/1 flag); price stays float64 so currency values keep exact decimals.
+CSV_SCHEMA = {
+    "rating": pa.float32(),
+    "customer_age": pa.int8(),
+    "verified_purchase": pa.int8(),
+    "helpful_votes": pa.int32(),
+    "review_date": pa.date32(),
+}
+
+# Projection carried through the rolling-average stage
+ROLLING_COLS = ["product_id", "product_name", "rating", "review_date", "sentiment_score"]
+
+# Low-cardinality columns stored as pandas categoricals after cleaning
+CATEGORY_COLS = ["product_id", "product_name", "category", "brand",
+                 "customer_country", "customer_city"]
+
+# review_date format when parsing from text (overridden by a guess from the data)
+DATE_FORMAT = "%Y-%m-%d"
+DATE_SAMPLE_SIZE = 10
+
+# SQLite column affinity per numpy/Arrow dtype kind (anything else is TEXT)
+SQLITE_TYPES = {"i": "INTEGER", "u": "INTEGER", "b": "INTEGER", "f": "REAL"}
+SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",
+]
+
+# Casing applied during text normalization
+LOWER_COLS = ["customer_email"]
+TITLE_COLS = ["product_name", "brand", "customer_name",
+              "customer_country", "customer_city", "category"]
+
+# TextBlob's PatternAnalyzer lexicon — reused directly by the JIT scorer
+LEXICON_PATH = os.path.join(os.path.dirname(textblob.__file__), "en", "en-sentiment.xml")
+# Tokenization mirrors TextBlob's find_tokens: "n't" is split off, quotes and
+# whitespace separate tokens, and leading/trailing punctuation is stripped
+# ("!" is kept as its own token because it boosts the preceding word)
+TOKEN_SEPARATOR = r"[\s'\"“”‘’]+"
+TOKEN_PUNCTUATION = ".,;:?()[]{}`@#$^&*+-|=~_"
+NEGATIONS = ["no", "not", "n't", "never"]
+
+# Token codes passed to the scoring kernel alongside lexicon ids (>= 0):
+# unknown words by length, which decides whether a pending negation
+# (length > 1) or modifier (length > 2) survives them, then "!" and negations
+SHORT_WORD, MEDIUM_WORD, LONG_WORD, EXCLAMATION, NEGATION = -1, -2, -3, -4, -5
+# Lexicon modifier kinds: adverbs modify the next word; "-ly" adverbs can
+# also carry a following negation ("really not good")
+ADVERB, LY_ADVERB = 1, 2
+
 
 # ══════════════════════════════════════════════
 #  EXTRACT
@@ -43,13 +102,23 @@ def extract(csv_path: str) -> pd.DataFrame:
     try:
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"CSV file not found at: {csv_path}")
-        df = pd.read_csv(csv_path)
+        try:
+            # Declared columns are converted straight to their type; only the rest are inferred.
+            # Empty text cells are read as nulls (as pandas does), not as "".
+            table = pv.read_csv(csv_path, convert_options=pv.ConvertOptions(
+                column_types=CSV_SCHEMA, strings_can_be_null=True))
+        except pa.ArrowInvalid as e:
+            # Malformed values in a typed column: fall back to inference so the
+            # quality assessment can still report them as type mismatches.
+            print(f"WARNING: CSV does not match schema ({e}); inferring column types.")
+            table = pv.read_csv(csv_path, convert_options=pv.ConvertOptions(strings_can_be_null=True))
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
         print(f"[EXTRACT] Loaded {len(df)} rows, {len(df.columns)} columns from {csv_path}")
         return df
     except FileNotFoundError as e:
         print(f"ERROR: {e}")
         raise
-    except pd.errors.ParserError as e:
+    except pa.ArrowInvalid as e:
         print(f"ERROR: Failed to parse CSV — {e}")
         raise
     except Exception as e:
@@ -85,13 +154,23 @@ def assess_quality(df: pd.DataFrame) -> None:
 
     # 3. Type mismatches
     print(f"\n[3] TYPE MISMATCHES")
-    checks = {
-        "price": pd.to_numeric(df["price"], errors="coerce").isna() & df["price"].notna(),
-        "rating": pd.to_numeric(df["rating"], errors="coerce").isna() & df["rating"].notna(),
-        "customer_age": pd.to_numeric(df["customer_age"], errors="coerce").isna() & df["customer_age"].notna(),
-        "helpful_votes": pd.to_numeric(df["helpful_votes"], errors="coerce").isna() & df["helpful_votes"].notna(),
-        "review_date": pd.to_datetime(df["review_date"], errors="coerce").isna() & df["review_date"].notna(),
+    parsers = {
+        "price": pd.to_numeric,
+        "rating": pd.to_numeric,
+        "customer_age": pd.to_numeric,
+        "helpful_votes": pd.to_numeric,
+        "review_date": _parse_dates,
     }
+    checks = {}
+    for col_name, parse in parsers.items():
+        values = df[col_name]
+        # Columns already typed by the CSV schema cannot hold mismatched values
+        if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+            continue
+        # Parse as StringDtype: to_numeric on Arrow strings yields NaN, which isna() misses
+        mask = parse(values.astype("string"), errors="coerce").isna()
+        mask &= values.notna()
+        checks[col_name] = mask
     issues_found = False
     for col_name, mask in checks.items():
         bad = mask.sum()
@@ -108,12 +187,31 @@ def assess_quality(df: pd.DataFrame) -> None:
 # ══════════════════════════════════════════════
 #  TRANSFORM — Cleaning
 # ══════════════════════════════════════════════
-def _normalize_text(s: str) -> str:
-    """Normalize unicode characters and strip whitespace."""
-    if isinstance(s, str):
-        s = unicodedata.normalize("NFKC", s)
-        s = s.strip()
-    return s
+def _parse_dates(s: pd.Series, errors: str = "coerce") -> pd.Series:
+    """
+    Parse dates with a single explicit format so pandas uses its vectorized
+    strptime path instead of the row-by-row dateutil fallback. The format is
+    guessed from a small sample of values (DATE_FORMAT if none can be guessed).
+    """
+    if not (pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s)):
+        return pd.to_datetime(s, errors=errors)  # already date-typed by the CSV schema
+    guesses = (guess_datetime_format(v) for v in s.dropna().head(DATE_SAMPLE_SIZE))
+    date_format = next((g for g in guesses if g), DATE_FORMAT)
+    return pd.to_datetime(s, format=date_format, errors=errors, cache=True)
+
+
+def _normalize_text(s: pd.Series) -> pd.Series:
+    """
+    Normalize unicode characters, strip whitespace and apply per-column casing.
+    Runs as Arrow compute kernels straight over the column's UTF-8 buffers,
+    without an intermediate pandas Series per step.
+    """
+    arr = pc.utf8_trim_whitespace(pc.utf8_normalize(pa.array(s), form="NFKC"))
+    if s.name in LOWER_COLS:
+        arr = pc.utf8_lower(arr)
+    elif s.name in TITLE_COLS:
+        arr = pc.utf8_title(arr)
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=s.index, name=s.name)
 
 
 def clean(df: pd.DataFrame) -> pd.DataFrame:
@@ -123,6 +221,7 @@ def clean(df: pd.DataFrame) -> pd.DataFrame:
       2. Normalize text fields
       3. Parse and validate date formats
       4. Remove duplicates
+      5. Convert low-cardinality columns to categoricals
     """
     print("[CLEAN] Starting data cleaning...")
     initial_rows = len(df)
@@ -134,24 +233,12 @@ def clean(df: pd.DataFrame) -> pd.DataFrame:
     df[num_cols] = df[num_cols].fillna(0)
     print(f"  [1] Missing values handled. Remaining nulls: {df.isnull().sum().sum()}")
 
-    # 2. Normalize text fields
-    for col in text_cols:
-        df[col] = df[col].apply(_normalize_text)
-
-    # Lowercase email
-    if "customer_email" in df.columns:
-        df["customer_email"] = df["customer_email"].str.lower()
-
-    # Title-case name/category fields
-    title_cols = ["product_name", "brand", "customer_name",
-                  "customer_country", "customer_city", "category"]
-    for col in title_cols:
-        if col in df.columns:
-            df[col] = df[col].str.strip().str.title()
+    # 2. Normalize text fields (unicode, whitespace and casing in one chain per column)
+    df[text_cols] = df[text_cols].apply(_normalize_text)
     print("  [2] Text fields normalized (unicode, whitespace, casing).")
 
     # 3. Parse and validate date formats
-    df["review_date"] = pd.to_datetime(df["review_date"], errors="coerce")
+    df["review_date"] = _parse_dates(df["review_date"])
     invalid_dates = df["review_date"].isna().sum()
     if invalid_dates > 0:
         print(f"  [3] WARNING: {invalid_dates} rows with unparseable dates (set to NaT).")
@@ -164,6 +251,11 @@ def clean(df: pd.DataFrame) -> pd.DataFrame:
     removed = initial_rows - len(df)
     print(f"  [4] Duplicates removed: {removed} rows dropped.")
 
+    # 5. Low-cardinality columns as categoricals (groupby/sort work on integer codes)
+    cat_cols = [col for col in CATEGORY_COLS if col in df.columns]
+    df[cat_cols] = df[cat_cols].astype("category")
+    print(f"  [5] Converted to categorical: {cat_cols}")
+
     print(f"[CLEAN] Done. Shape: {df.shape}\n")
     return df
 
@@ -171,30 +263,158 @@ def clean(df: pd.DataFrame) -> pd.DataFrame:
 # ══════════════════════════════════════════════
 #  TRANSFORM — Sentiment & Rolling Average
 # ══════════════════════════════════════════════
-def _get_sentiment(text: str) -> float:
-    """Return polarity score in [-1.0, 1.0] using TextBlob."""
-    if not text or not isinstance(text, str):
-        return 0.0
-    return TextBlob(text).sentiment.polarity
+@lru_cache(maxsize=1)
+def _load_lexicon(lexicon_path: str = LEXICON_PATH) -> tuple[pa.Array, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build the sentiment lexicon once from TextBlob's en-sentiment.xml.
+    Returns (vocab: Arrow string array of words, then polarity, intensity and
+    modifier kind arrays aligned with vocab). Scores are averaged over the
+    senses of each part-of-speech, then over parts-of-speech, as
+    PatternAnalyzer does.
+    """
+    try:
+        senses = {}
+        for node in ET.parse(lexicon_path).getroot().iter("word"):
+            form = node.get("form")
+            if form and " " not in form:
+                senses.setdefault(form, {}).setdefault(node.get("pos"), []).append(
+                    (float(node.get("polarity", 0.0)), float(node.get("intensity", 1.0))))
+    except (OSError, ET.ParseError) as e:
+        print(f"ERROR: Failed to load sentiment lexicon — {e}")
+        raise
+    lexicon = {}  # form -> (polarity, intensity, is adverb)
+    for form, by_pos in senses.items():
+        polarity, intensity = np.mean([np.mean(psi, axis=0) for psi in by_pos.values()], axis=0)
+        lexicon[form] = (polarity, intensity, "RB" in by_pos)
+    # Like textblob.en.Sentiment, score "-ly" adverbs as their adjective ("terrible" -> "terribly")
+    for form, by_pos in senses.items():
+        if "JJ" in by_pos:
+            stem = form[:-1] + "i" if form.endswith("y") else form
+            stem = stem[:-2] if stem.endswith("le") else stem
+            lexicon[stem + "ly"] = (*np.mean(by_pos["JJ"], axis=0), True)
+    vocab = pa.array(list(lexicon), type=pa.string())
+    polarity, intensity, adverb = map(np.array, zip(*lexicon.values()))
+    ly = np.array([form.endswith("ly") for form in lexicon])
+    modifier = np.where(adverb, np.where(ly, LY_ADVERB, ADVERB), 0).astype(np.int8)
+    return vocab, polarity, intensity, modifier
+
+
+def _tokenize(texts: pd.Series, vocab: pa.Array) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Map each text to one code per token, packed CSR-style: the codes of
+    row r are codes[offsets[r]:offsets[r + 1]]. A code is the token's
+    lexicon id, or one of the negative token codes for other tokens.
+    Splitting, lowercasing and the vocab lookup all run as Arrow kernels.
+    """
+    texts = pc.replace_substring(pa.array(texts, type=pa.string()), "n't", " n't")
+    texts = pc.replace_substring(texts, "!", " ! ")
+    tokens = pc.split_pattern_regex(pc.utf8_lower(texts), pattern=TOKEN_SEPARATOR)
+    words = pc.utf8_trim(pc.list_flatten(tokens), characters=TOKEN_PUNCTUATION)
+    ids = pc.index_in(words, value_set=vocab).fill_null(-1).to_numpy()
+    lengths = pc.utf8_length(words).to_numpy()
+    codes = np.select(
+        [ids >= 0, pc.equal(words, "!").to_numpy(zero_copy_only=False),
+         pc.is_in(words, value_set=pa.array(NEGATIONS)).to_numpy(zero_copy_only=False),
+         lengths <= 1, lengths == 2],
+        [ids, EXCLAMATION, NEGATION, SHORT_WORD, MEDIUM_WORD], LONG_WORD).astype(np.int32)
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum(pc.list_value_length(tokens).fill_null(0).to_numpy(), out=offsets[1:])
+    return offsets, codes
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _get_sentiment(offsets: np.ndarray, codes: np.ndarray, polarities: np.ndarray,
+                   intensities: np.ndarray, modifiers: np.ndarray) -> np.ndarray:
+    """
+    Return PatternAnalyzer polarity in [-1.0, 1.0] per row (0.0 if no lexicon words):
+    the mean over lexicon words, where a word merges into a preceding adverb
+    ("very good"), is scaled by -0.5 after a negation ("not good") and is
+    boosted by a following "!".
+    """
+    n_rows = offsets.shape[0] - 1
+    scores = np.zeros(n_rows, dtype=np.float32)
+    for r in prange(n_rows):
+        total, count = 0.0, 0
+        # Last assessment (polarity, intensity, negated) and pending modifier / negation
+        p, i, negated = 0.0, 1.0, False
+        modifier, negation = 0, False
+        for k in range(offsets[r], offsets[r + 1]):
+            c = codes[k]
+            if c >= 0:
+                if modifier:
+                    p = min(max(polarities[c] * i, -1.0), 1.0)
+                else:
+                    if count:
+                        total += -0.5 * p if negated else p
+                    count += 1
+                    p, negated = polarities[c], False
+                i = intensities[c]
+                if negation:
+                    i, negated = 1.0 / i, True
+                modifier, negation = modifiers[c], False
+                continue
+            if c == NEGATION:
+                negation = True
+            elif c == MEDIUM_WORD or c == LONG_WORD:
+                negation = False
+            if negation and modifier == LY_ADVERB:
+                negated, negation = True, False
+            elif c == LONG_WORD:
+                modifier = 0
+            if c == EXCLAMATION and count:
+                p = min(max(p * 1.25, -1.0), 1.0)
+        if count:
+            total += -0.5 * p if negated else p
+            scores[r] = total / count
+    return scores
 
 
 def add_sentiment(df: pd.DataFrame) -> pd.DataFrame:
     """Calculate sentiment scores from review_text."""
     print("[TRANSFORM] Calculating sentiment scores...")
-    df["sentiment_score"] = df["review_text"].apply(_get_sentiment)
+    vocab, polarity, intensity, modifier = _load_lexicon()
+    offsets, codes = _tokenize(df["review_text"], vocab)
+    df["sentiment_score"] = _get_sentiment(offsets, codes, polarity, intensity, modifier)
     print(f"  Sentiment stats: mean={df['sentiment_score'].mean():.4f}, "
           f"min={df['sentiment_score'].min():.4f}, max={df['sentiment_score'].max():.4f}")
     return df
 
 
+@njit(parallel=True, nogil=True, cache=True)
+def _grouped_rolling_mean(values: np.ndarray, starts: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean over up to `window` rows within each group (min_periods=1).
+    Groups are contiguous runs of rows; group g begins at starts[g].
+    """
+    n_rows, n_groups = values.shape[0], starts.shape[0]
+    means = np.empty(n_rows, dtype=np.float32)
+    for g in prange(n_groups):
+        start = starts[g]
+        end = starts[g + 1] if g + 1 < n_groups else n_rows
+        total = 0.0
+        for i in range(start, end):
+            total += values[i]
+            if i - start >= window:
+                total -= values[i - window]
+            means[i] = total / min(i - start + 1, window)
+    return means
+
+
 def add_rolling_average(df: pd.DataFrame, window: int = ROLLING_WINDOW) -> pd.DataFrame:
-    """Calculate rolling average sentiment per product, sorted by date."""
+    """
+    Calculate rolling average sentiment per product, sorted by date.
+    Returns the rows sorted by (product_id, review_date), keeping the input index.
+    """
     print(f"[TRANSFORM] Calculating rolling average sentiment (window={window})...")
-    df = df.sort_values(["product_id", "review_date"]).reset_index(drop=True)
-    df["rolling_avg_sentiment"] = (
-        df.groupby("product_id")["sentiment_score"]
-        .transform(lambda x: x.rolling(window=window, min_periods=1).mean())
-    )
+    df = df.sort_values(["product_id", "review_date"])
+    keys = df["product_id"]
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        keys = keys.cat.codes  # compare the small integer codes
+    keys = keys.to_numpy()
+    # Rows are sorted by product, so each product is one contiguous run
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    df["rolling_avg_sentiment"] = _grouped_rolling_mean(
+        df["sentiment_score"].to_numpy(), starts, window)
     print(f"  Rolling avg stats: mean={df['rolling_avg_sentiment'].mean():.4f}, "
           f"min={df['rolling_avg_sentiment'].min():.4f}, max={df['rolling_avg_sentiment'].max():.4f}")
     return df
@@ -203,40 +423,101 @@ def add_rolling_average(df: pd.DataFrame, window: int = ROLLING_WINDOW) -> pd.Da
 # ══════════════════════════════════════════════
 #  LOAD
 # ══════════════════════════════════════════════
-def load(df: pd.DataFrame, db_path: str) -> None:
-    """Insert cleaned data into SQLite database with error handling."""
+def _sqlite_type(dtype) -> str:
+    """SQLite column affinity for a pandas dtype (categoricals use their categories' type)."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    return SQLITE_TYPES.get(dtype.kind, "TEXT")
+
+
+def _replace_table(conn: sqlite3.Connection, table: str, df: pd.DataFrame,
+                   columns: dict | None = None, date_cols: tuple = ()) -> None:
+    """
+    Recreate `table` with column types taken from df's dtypes, then bulk-insert df.
+    columns optionally selects and renames source columns ({source: table column});
+    date_cols are written as ISO date strings. Rows are zipped from per-column
+    object arrays, so no intermediate frame is built.
+    """
+    columns = columns or {col: col for col in df.columns}
+    values = [df[src].dt.strftime("%Y-%m-%d") if src in date_cols else df[src] for src in columns]
+    schema = ", ".join(f'"{name}" {_sqlite_type(col.dtype)}' for name, col in zip(columns.values(), values))
+    placeholders = ", ".join("?" * len(columns))
+    # Convert each column to Python objects in one pass (nulls -> None); iterating
+    # Arrow-backed or categorical Series directly boxes every element separately
+    rows = zip(*(col.to_numpy(dtype=object, na_value=None) for col in values))
+    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    conn.execute(f'CREATE TABLE "{table}" ({schema})')
+    conn.executemany(f'INSERT INTO "{table}" VALUES ({placeholders})', rows)
+
+
+def load(df: pd.DataFrame, rolling_df: pd.DataFrame, db_path: str) -> None:
+    """
+    Insert cleaned data into SQLite database with error handling.
+    df feeds the full reviews table; rolling_df (the output of
+    add_rolling_average) feeds product_rolling_sentiment.
+    """
     try:
         conn = sqlite3.connect(db_path)
-
-        # Prepare data for SQLite (convert datetime to string)
-        load_df = df.copy()
-        load_df["review_date"] = load_df["review_date"].dt.strftime("%Y-%m-%d")
-
-        # 1. Full cleaned reviews table
-        load_df.to_sql("reviews", conn, if_exists="replace", index=False)
-        print(f"[LOAD] 'reviews' table: {len(load_df)} rows written.")
-
-        # 2. product_rolling_sentiment table (schema matches app.py / models.py)
-        #    API expects: product_id, product_name, rating (as latest_sentiment_score),
-        #                 rolling_average_sentiment, date (for ORDER BY)
-        rolling_df = load_df[["product_id", "product_name", "rating",
-                              "rolling_avg_sentiment", "review_date"]].copy()
-        rolling_df = rolling_df.rename(columns={
-            "rolling_avg_sentiment": "rolling_average_sentiment",
-            "review_date": "date",
-        })
-        rolling_df.to_sql("product_rolling_sentiment", conn, if_exists="replace", index=False)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+
+        # All tables are replaced in a single transaction
+        with conn:
+            conn.execute("BEGIN")
+            # 1. Full cleaned reviews table
+            _replace_table(conn, "reviews", df, date_cols=("review_date",))
+            # 2. product_rolling_sentiment table (schema matches app.py / models.py)
+            #    API expects: product_id, product_name, rating (as latest_sentiment_score),
+            #                 rolling_average_sentiment, date (for ORDER BY)
+            _replace_table(conn, "product_rolling_sentiment", rolling_df, columns={
+                "product_id": "product_id",
+                "product_name": "product_name",
+                "rating": "rating",
+                "rolling_avg_sentiment": "rolling_average_sentiment",
+                "review_date": "date",
+            }, date_cols=("review_date",))
+            # Latest-row lookups per product become an index seek
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_prs_pid_date "
+                         "ON product_rolling_sentiment(product_id, date DESC)")
+            # 3. latest_product_sentiment: most recent row per product (what the API serves)
+            conn.execute("DROP TABLE IF EXISTS latest_product_sentiment")
+            conn.execute("""
+                CREATE TABLE latest_product_sentiment (
+                    product_id INTEGER PRIMARY KEY,
+                    product_name TEXT,
+                    rating REAL,
+                    rolling_average_sentiment REAL,
+                    date TEXT
+                )
+            """)
+            # SQLite takes bare columns from the MAX(date) row of each group
+            conn.execute("""
+                INSERT INTO latest_product_sentiment
+                SELECT product_id, product_name, rating, rolling_average_sentiment, MAX(date)
+                FROM product_rolling_sentiment
+                GROUP BY product_id
+            """)
+            conn.execute("ANALYZE")
+        print(f"[LOAD] 'reviews' table: {len(df)} rows written.")
         print(f"[LOAD] 'product_rolling_sentiment' table: {len(rolling_df)} rows written.")
+        print("[LOAD] 'latest_product_sentiment' table: materialized from product_rolling_sentiment.")
 
-        # 3. Verify
-        tables = pd.read_sql("SELECT name FROM sqlite_master WHERE type='table'", conn)
+        # 4. Verify
+        tables = pd.read_sql("SELECT name FROM sqlite_master WHERE type='table' "
+                             "AND name NOT LIKE 'sqlite_%'", conn)
         print(f"\n  Tables in database: {tables['name'].tolist()}")
         for tbl in tables["name"]:
             cnt = pd.read_sql(f"SELECT COUNT(*) as cnt FROM {tbl}", conn).iloc[0, 0]
             print(f"    {tbl}: {cnt} rows")
 
         conn.close()
-        print(f"\n[LOAD] Database saved to: {os.path.abspath(db_path)}\n")
+        print(f"\n[LOAD] Database saved to: {os.path.abspath(db_path)}")
+
+        # 5. Columnar copies for bulk analytics (Parquet + Feather)
+        base_path = os.path.splitext(db_path)[0]
+        df.to_parquet(f"{base_path}.parquet", engine="pyarrow", compression="zstd", index=False)
+        df.to_feather(f"{base_path}.feather")
+        print(f"[LOAD] Parquet/Feather copies saved to: {os.path.abspath(base_path)}.{{parquet,feather}}\n")
 
     except sqlite3.Error as e:
         print(f"ERROR: SQLite error — {e}")
@@ -267,10 +548,13 @@ def main():
     df = add_sentiment(df)
 
     # TRANSFORM — Rolling Average Sentiment per Product ★
-    df = add_rolling_average(df, window=ROLLING_WINDOW)
+    #   Only the columns the rolling step and product_rolling_sentiment need are
+    #   sorted; the result is aligned back onto df by index for the reviews table.
+    rolling_df = add_rolling_average(df[ROLLING_COLS], window=ROLLING_WINDOW)
+    df["rolling_avg_sentiment"] = rolling_df["rolling_avg_sentiment"]
 
     # LOAD
-    load(df, DB_PATH)
+    load(df, rolling_df, DB_PATH)
 
     print("=" * 60)
     print("  ETL PIPELINE — COMPLETE")
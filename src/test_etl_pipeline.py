@@ -0,0 +1,90 @@
+# src/test_etl_pipeline.py
+"""
+Unit Tests for the ETL Transform Step
+=====================================
+Run locally:
+    pytest test_etl_pipeline.py -v
+
+No API server or database is needed; the tests run the transform
+functions on in-memory frames.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from textblob import TextBlob
+
+from etl_pipeline import CSV_PATH, ROLLING_WINDOW, add_rolling_average, add_sentiment
+
+
+# ═══════════════════════════════════════════════════════
+#  Test Suite A: Sentiment Scoring
+# ═══════════════════════════════════════════════════════
+
+class TestSentimentScoring:
+    """add_sentiment must reproduce TextBlob's PatternAnalyzer polarity."""
+
+    def _assert_matches_textblob(self, texts: pd.Series):
+        df = add_sentiment(pd.DataFrame({"review_text": texts}))
+        expected = [TextBlob(text).sentiment.polarity for text in texts]
+        np.testing.assert_allclose(df["sentiment_score"], expected, atol=1e-6)
+
+    @pytest.mark.parametrize("text", [
+        "This is not good.",
+        "Not bad at all!",
+        "It is not a good product",
+        "I don't like it, never happy",
+        "really not good",
+        "not very good",
+        "very good!!",
+        "terribly bad",
+        "Terrible... not great",
+        "No. Good",
+        "",
+    ])
+    def test_negations_and_modifiers(self, text):
+        """Negated, modified and boosted words score as in TextBlob."""
+        self._assert_matches_textblob(pd.Series([text]))
+
+    @pytest.mark.skipif(not os.path.exists(CSV_PATH), reason="reviews.csv not available")
+    def test_reviews_csv_matches_textblob(self):
+        """Every review in the dataset scores as in TextBlob."""
+        texts = pd.read_csv(CSV_PATH)["review_text"].dropna().reset_index(drop=True)
+        self._assert_matches_textblob(texts)
+
+
+# ═══════════════════════════════════════════════════════
+#  Test Suite B: Rolling Average
+# ═══════════════════════════════════════════════════════
+
+class TestRollingAverage:
+    """add_rolling_average must match pandas' grouped rolling mean."""
+
+    @pytest.fixture
+    def reviews(self):
+        """Single-row group, a group shorter than the window, and NaT dates."""
+        return pd.DataFrame({
+            "product_id": [3, 1, 3, 2, 3, 3, 2, 3, 4],
+            "review_date": pd.to_datetime([
+                "2024-03-05", "2024-01-01", "2024-03-01", "2024-02-02", None,
+                "2024-03-03", "2024-02-01", "2024-03-04", None,
+            ]),
+            "sentiment_score": np.array(
+                [0.5, -0.2, 0.1, 0.3, -0.4, 0.8, 0.0, 0.25, 0.6], dtype=np.float32),
+        })
+
+    @pytest.mark.parametrize("key_dtype", ["int64", "category"])
+    def test_matches_groupby_rolling(self, reviews, key_dtype):
+        """Per-product trailing mean over up to ROLLING_WINDOW reviews, in date order."""
+        reviews["product_id"] = reviews["product_id"].astype(key_dtype)
+        expected = (
+            reviews.sort_values(["product_id", "review_date"])
+            .groupby("product_id", observed=True)["sentiment_score"]
+            .rolling(ROLLING_WINDOW, min_periods=1).mean()
+            .reset_index(level=0, drop=True)
+        )
+        result = add_rolling_average(reviews)
+        assert result.index.equals(expected.index), "Rows not sorted by (product_id, review_date)"
+        np.testing.assert_allclose(result["rolling_avg_sentiment"], expected, rtol=1e-6)